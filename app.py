@@ -5,6 +5,9 @@ from datetime import datetime
 from flask import Flask, render_template, request, jsonify, session, redirect, url_for
 import logging
 from werkzeug.utils import secure_filename
+from search_index import SubmissionIndex
+from data_versions import DataVersions, FileWatcher, VersionedCache
+from records import teams_from_json, users_from_json, winners_from_rows
 
 logging.basicConfig(level=logging.DEBUG)
 
@@ -25,6 +28,16 @@ SUBMISSIONS_FILE = 'submissions.json'
 USERS_AND_TEAMS_FILE = 'users_and_teams.json'
 ADMIN_CREDENTIALS_FILE = 'admin_credentials.txt'
 HACKATHON_DETAILS_FILE = 'hackathon_details.json'
+WINNERS_FILE = 'winners.csv'
+WINNERS_FIELDS = ['team_name', 'project_name', 'points']
+
+# Files backing each dataset that is cached per worker
+DATA_FILES = {
+    'details': HACKATHON_DETAILS_FILE,
+    'users': USERS_AND_TEAMS_FILE,
+    'submissions': SUBMISSIONS_FILE,
+    'winners': WINNERS_FILE,
+}
 
 UPLOAD_FOLDER = 'static/images'
 ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif', 'svg'}
@@ -34,6 +47,27 @@ if not os.path.exists(USERS_AND_TEAMS_FILE):
     with open(USERS_AND_TEAMS_FILE, 'w') as f:
         json.dump({'teams': [], 'users': []}, f, indent=2)
 
+# Version counters shared by all workers. Every write bumps its dataset's
+# counter, and each worker reloads a cached dataset once its counter moves.
+data_versions = DataVersions()
+data_cache = VersionedCache(data_versions)
+
+# Pick up edits made directly to the mounted data files. The watcher thread
+# is started by the first request each worker handles, not at import, so it
+# also runs in workers forked from a preloading gunicorn master.
+file_watcher = None
+if os.environ.get('WATCH_DATA_FILES'):
+    file_watcher = FileWatcher(data_versions, DATA_FILES, float(os.environ.get('WATCH_DATA_INTERVAL', '2')))
+
+@app.before_request
+def start_file_watcher():
+    if file_watcher:
+        file_watcher.ensure_running()
+
+# In-memory search index over submissions, built at startup and then kept
+# current by appending new submissions, whichever worker saved them
+submission_index = SubmissionIndex()
+
 def load_submissions():
     if os.path.exists(SUBMISSIONS_FILE):
         with open(SUBMISSIONS_FILE, 'r') as f:
@@ -41,11 +75,33 @@ def load_submissions():
     return []
 
 def save_submission(submission):
-    submissions = load_submissions()
-    submission['submitted_at'] = datetime.now().isoformat()
-    submissions.append(submission)
-    with open(SUBMISSIONS_FILE, 'w') as f:
-        json.dump(submissions, f, indent=2)
+    # Read, append and write under the shared write lock so that workers
+    # saving at the same time can't drop each other's submissions
+    with data_versions.writing('submissions', SUBMISSIONS_FILE) as version:
+        submissions = load_submissions()
+        submission['submitted_at'] = datetime.now().isoformat()
+        submissions.append(submission)
+        with open(SUBMISSIONS_FILE, 'w') as f:
+            json.dump(submissions, f, indent=2)
+    submission_index.sync(submissions, version, data_versions.external_edits('submissions'))
+
+def get_submission_index():
+    # Submissions are held once per worker, as the records in the index
+    version = data_versions.get('submissions')
+    generation = data_versions.external_edits('submissions')
+    if submission_index.version != version or submission_index.generation != generation:
+        submission_index.sync(load_submissions(), version, generation)
+    return submission_index
+
+def list_submissions():
+    return [submission.to_dict() for submission in get_submission_index().documents()]
+
+# Build the search index at startup so that no search request has to wait
+# for it. Under gunicorn --preload the workers inherit the built index.
+try:
+    get_submission_index()
+except Exception as e:
+    logging.error(f"Error building submission index: {str(e)}")
 
 def load_users_and_teams():
     try:
@@ -58,15 +114,25 @@ def load_users_and_teams():
 
 def save_users_and_teams(teams, users):
     try:
-        with open(USERS_AND_TEAMS_FILE, 'w') as f:
+        with data_versions.writing('users', USERS_AND_TEAMS_FILE), open(USERS_AND_TEAMS_FILE, 'w') as f:
             json.dump({'teams': teams, 'users': users}, f, indent=2)
     except Exception as e:
         logging.error(f"Error saving users and teams: {str(e)}")
 
+def load_registrants():
+    teams, users = load_users_and_teams()
+    users = users_from_json(users)
+    # Lower-cased emails for case-insensitive registration checks
+    emails = frozenset(user.email.lower() for user in users)
+    return teams_from_json(teams), users, emails
+
+def cached_registrants():
+    return data_cache.get('users', load_registrants)
+
 def is_registered_email(email):
     try:
-        teams, users = load_users_and_teams()
-        return any(user['email'].lower() == email.lower() for user in users)
+        _, _, emails = cached_registrants()
+        return email.lower() in emails
     except Exception as e:
         logging.error(f"Error checking registered emails: {str(e)}")
         return False
@@ -103,20 +169,38 @@ def load_hackathon_details():
 
 def save_hackathon_details(details):
     try:
-        with open(HACKATHON_DETAILS_FILE, 'w') as f:
+        with data_versions.writing('details', HACKATHON_DETAILS_FILE), open(HACKATHON_DETAILS_FILE, 'w') as f:
             json.dump(details, f, indent=2)
         return True
     except Exception as e:
         logging.error(f"Error saving hackathon details: {str(e)}")
         return False
 
+def cached_hackathon_details():
+    return data_cache.get('details', load_hackathon_details)
+
+def load_winners():
+    with open(WINNERS_FILE, 'r') as f:
+        return list(csv.DictReader(f))
+
+def save_winners(winners):
+    with data_versions.writing('winners', WINNERS_FILE), open(WINNERS_FILE, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=WINNERS_FIELDS)
+        writer.writeheader()
+        writer.writerows(winners)
+
+def load_leaderboard():
+    winners = winners_from_rows(load_winners())
+    winners.sort(key=lambda x: x.points, reverse=True)
+    return winners
+
 def allowed_file(filename):
     return '.' in filename and \
            filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
 @app.route('/')
 def index():
-    hackathon_details = load_hackathon_details()
+    hackathon_details = cached_hackathon_details()
     return render_template('index.html', 
                          hackathon_details=hackathon_details,
                          now=datetime.now())
@@ -139,7 +223,7 @@ def verify_email():
 @app.route('/submit', methods=['POST'])
 def submit():
     try:
-        details = load_hackathon_details()
+        details = cached_hackathon_details()
         deadline_str = details.get('deadline', '')
         if deadline_str:
             deadline = datetime.strptime(deadline_str, '%m/%d/%Y, %I:%M:%S %p')
@@ -191,7 +275,7 @@ def submit():
 @app.route('/get_deadline')
 def get_deadline():
     try:
-        details = load_hackathon_details()
+        details = cached_hackathon_details()
         return jsonify({'deadline': details.get('deadline', '')})
     except Exception as e:
         logging.error(f"Error reading deadline: {str(e)}")
@@ -200,12 +284,26 @@ def get_deadline():
 @app.route('/submissions')
 def get_submissions():
     try:
-        submissions = load_submissions()
+        submissions = list_submissions()
         return jsonify({'submissions': submissions})
     except Exception as e:
         logging.error(f"Error loading submissions: {str(e)}")
         return jsonify({'error': 'Could not load submissions'}), 500
 
+@app.route('/submissions/search')
+def search_submissions():
+    try:
+        query = request.args.get('q', '').strip()
+        if not query:
+            return jsonify({'submissions': list_submissions()})
+
+        limit = request.args.get('limit', 50, type=int)
+        submissions = get_submission_index().search(query, limit=max(1, min(limit, 500)))
+        return jsonify({'submissions': submissions})
+    except Exception as e:
+        logging.error(f"Error searching submissions: {str(e)}")
+        return jsonify({'error': 'Could not search submissions'}), 500
+
 @app.route('/admin/login', methods=['POST'])
 def admin_login():
     try:
@@ -286,7 +384,7 @@ def get_teams():
         return jsonify({'success': False, 'message': 'Unauthorized'}), 401
 
     try:
-        teams, _ = load_users_and_teams()
+        teams, _, _ = cached_registrants()
         return jsonify({'success': True, 'teams': teams})
     except Exception as e:
         logging.error(f"Error loading teams: {str(e)}")
@@ -508,8 +606,8 @@ def get_registered_emails():
         return jsonify({'success': False, 'message': 'Unauthorized'}), 401
 
     try:
-        _, users = load_users_and_teams()
-        return jsonify({'success': True, 'emails': users})
+        _, users, _ = cached_registrants()
+        return jsonify({'success': True, 'emails': [user.to_dict() for user in users]})
     except Exception as e:
         logging.error(f"Error reading emails: {str(e)}")
         return jsonify({'success': False, 'message': 'Error reading emails'}), 500
@@ -517,13 +615,8 @@ def get_registered_emails():
 @app.route('/winners')
 def get_winners():
     try:
-        with open('winners.csv', 'r') as f:
-            reader = csv.DictReader(f)
-            winners = list(reader)
-            for winner in winners:
-                winner['points'] = int(winner['points'])
-            winners.sort(key=lambda x: x['points'], reverse=True)
-        return jsonify({'winners': winners})
+        winners = data_cache.get('winners', load_leaderboard)
+        return jsonify({'winners': [winner.to_row() for winner in winners]})
     except Exception as e:
         logging.error(f"Error loading winners: {str(e)}")
         return jsonify({'error': 'Could not load winners'}), 500
@@ -534,9 +627,7 @@ def get_admin_winners():
         return jsonify({'success': False, 'message': 'Unauthorized'}), 401
 
     try:
-        with open('winners.csv', 'r') as f:
-            reader = csv.DictReader(f)
-            winners = list(reader)
+        winners = load_winners()
         return jsonify({'success': True, 'winners': winners})
     except Exception as e:
         logging.error(f"Error reading winners: {str(e)}")
@@ -556,10 +647,7 @@ def add_winner():
         if not all([team_name, project_name, points]):
             return jsonify({'success': False, 'message': 'All fields are required'}), 400
 
-        winners = []
-        with open('winners.csv', 'r') as f:
-            reader = csv.DictReader(f)
-            winners = list(reader)
+        winners = load_winners()
 
         winners.append({
             'team_name': team_name,
@@ -567,10 +655,7 @@ def add_winner():
             'points': points
         })
 
-        with open('winners.csv', 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=['team_name', 'project_name', 'points'])
-            writer.writeheader()
-            writer.writerows(winners)
+        save_winners(winners)
 
         return jsonify({'success': True, 'message': 'Winner added successfully'})
     except Exception as e:
@@ -594,26 +679,21 @@ def update_winner():
 
         winners = []
         winner_updated = False
-        with open('winners.csv', 'r') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                if row['team_name'] == old_team_name:
-                    winners.append({
-                        'team_name': team_name,
-                        'project_name': project_name,
-                        'points': points
-                    })
-                    winner_updated = True
-                else:
-                    winners.append(row)
+        for row in load_winners():
+            if row['team_name'] == old_team_name:
+                winners.append({
+                    'team_name': team_name,
+                    'project_name': project_name,
+                    'points': points
+                })
+                winner_updated = True
+            else:
+                winners.append(row)
 
         if not winner_updated:
             return jsonify({'success': False, 'message': 'Winner not found'}), 404
 
-        with open('winners.csv', 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=['team_name', 'project_name', 'points'])
-            writer.writeheader()
-            writer.writerows(winners)
+        save_winners(winners)
 
         return jsonify({'success': True, 'message': 'Winner updated successfully'})
     except Exception as e:
@@ -634,21 +714,16 @@ def delete_winner():
 
         winners = []
         winner_found = False
-        with open('winners.csv', 'r') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                if row['team_name'] != team_name:
-                    winners.append(row)
-                else:
-                    winner_found = True
+        for row in load_winners():
+            if row['team_name'] != team_name:
+                winners.append(row)
+            else:
+                winner_found = True
 
         if not winner_found:
             return jsonify({'success': False, 'message': 'Winner not found'}), 404
 
-        with open('winners.csv', 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=['team_name', 'project_name', 'points'])
-            writer.writeheader()
-            writer.writerows(winners)
+        save_winners(winners)
 
         return jsonify({'success': True, 'message': 'Winner deleted successfully'})
     except Exception as e:
@@ -663,7 +738,7 @@ def admin_logout():
 @app.route('/hackathon-details')
 def get_hackathon_details():
     try:
-        details = load_hackathon_details()
+        details = cached_hackathon_details()
         return jsonify(details)
     except Exception as e:
         logging.error(f"Error getting hackathon details: {str(e)}")
@@ -677,10 +752,10 @@ def check_github():
         if not github:
             return jsonify({'success': False, 'message': 'GitHub URL is required'}), 400
 
-        submissions = load_submissions()
+        submissions = get_submission_index().documents()
         
         # Check if GitHub URL already exists in submissions
-        if any(s.get('github_repo') == github for s in submissions):
+        if any(s.github_repo == github for s in submissions):
             return jsonify({'success': False, 'message': 'GitHub repository already submitted'}), 400
 
         return jsonify({'success': True, 'message': 'GitHub URL is unique'}), 200
@@ -0,0 +1,203 @@
+import logging
+import mmap
+import os
+import struct
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:
+    # Not available on Windows, where writes go unlocked
+    fcntl = None
+
+# Datasets whose version is shared between worker processes. The order is
+# the slot layout of the versions file, so only ever append to it.
+DATASETS = ('details', 'users', 'submissions', 'winners')
+
+DATA_VERSIONS_FILE = os.environ.get('DATA_VERSIONS_FILE', 'data_versions.bin')
+
+# Each slot holds the dataset version, the mtime of its file when the
+# version was last bumped, so file watchers in several workers agree on
+# whether a change has already been seen, and the number of changes made
+# outside the app, which may have rewritten rather than appended to a file.
+SLOT = struct.Struct('<QQQ')
+
+
+class DataVersions:
+    """Per-dataset version counters in a memory-mapped file.
+
+    Every worker maps the same file, so a write bumped by one worker is
+    visible to the others on their next read of the counter, without any
+    file I/O on the read path.
+
+    The file is opened on first use in each process. A forked child drops
+    the descriptor it inherited and opens its own, because flock locks
+    belong to the open file description and an inherited one would not
+    keep workers forked from the same parent apart.
+    """
+
+    def __init__(self, path=DATA_VERSIONS_FILE):
+        self.path = path
+        self._fd = None
+        self._map = None
+        self._open_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        # Windows has no fork, so there is nothing to reopen there
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=self._forget)
+
+    def _forget(self):
+        if self._map is not None:
+            self._map.close()
+            os.close(self._fd)
+        self._fd = None
+        self._map = None
+        self._open_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+
+    def _mapping(self):
+        if self._map is None:
+            with self._open_lock:
+                if self._map is None:
+                    size = SLOT.size * len(DATASETS)
+                    fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+                    _flock(fd, True)
+                    try:
+                        if os.fstat(fd).st_size < size:
+                            os.ftruncate(fd, size)
+                    finally:
+                        _flock(fd, False)
+                    self._fd = fd
+                    self._map = mmap.mmap(fd, size)
+        return self._map
+
+    @contextmanager
+    def _locked(self):
+        # Writes are rare, so serialise them across workers with a file lock.
+        # Threads share the process's descriptor, which flock does not keep
+        # apart, so they also take a thread lock.
+        mapping = self._mapping()
+        with self._write_lock:
+            _flock(self._fd, True)
+            try:
+                yield mapping
+            finally:
+                _flock(self._fd, False)
+
+    def _offset(self, dataset):
+        return DATASETS.index(dataset) * SLOT.size
+
+    def get(self, dataset):
+        return SLOT.unpack_from(self._mapping(), self._offset(dataset))[0]
+
+    def external_edits(self, dataset):
+        """Number of changes to dataset's file noticed by check_file."""
+        return SLOT.unpack_from(self._mapping(), self._offset(dataset))[2]
+
+    @contextmanager
+    def writing(self, dataset, path):
+        """Hold the write lock while dataset's file at path is written.
+
+        Yields the version the write will have. When the block completes the
+        version is bumped and the file's new mtime recorded, still under the
+        lock, so check_file never mistakes the write for an outside edit and
+        writes from different workers never interleave.
+        """
+        offset = self._offset(dataset)
+        with self._locked() as mapping:
+            version, _, edits = SLOT.unpack_from(mapping, offset)
+            try:
+                yield version + 1
+            finally:
+                # Bump even if the write failed, as the file may have changed
+                SLOT.pack_into(mapping, offset, version + 1, _mtime(path), edits)
+
+    def check_file(self, dataset, path):
+        """Bump dataset if its file changed since the version was last bumped."""
+        offset = self._offset(dataset)
+        if SLOT.unpack_from(self._mapping(), offset)[1] == _mtime(path):
+            return False
+        with self._locked() as mapping:
+            # Stat again now that no write through the app is in progress
+            mtime = _mtime(path)
+            version, seen, edits = SLOT.unpack_from(mapping, offset)
+            if seen == mtime:
+                return False
+            # The first mtime recorded is not known to be an edit in place
+            if seen:
+                edits += 1
+            SLOT.pack_into(mapping, offset, version + 1, mtime, edits)
+            return True
+
+
+def _flock(fd, exclusive):
+    if fcntl:
+        fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_UN)
+
+
+def _mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return 0
+
+
+class VersionedCache:
+    """Per-process cache of loaded datasets, invalidated by DataVersions."""
+
+    def __init__(self, versions):
+        self.versions = versions
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, dataset, loader):
+        version = self.versions.get(dataset)
+        entry = self._entries.get(dataset)
+        if entry is not None and entry[0] == version:
+            return entry[1]
+
+        with self._lock:
+            entry = self._entries.get(dataset)
+            if entry is not None and entry[0] == version:
+                return entry[1]
+            value = loader()
+            self._entries[dataset] = (version, value)
+            return value
+
+
+class FileWatcher:
+    """Poll data files for edits made outside the app and bump their versions.
+
+    files maps dataset names to paths. Polling runs in a daemon thread that
+    ensure_running starts once per process, so workers forked from a
+    preloading parent each get their own.
+    """
+
+    def __init__(self, versions, files, interval=2.0):
+        self.versions = versions
+        self.files = files
+        self.interval = interval
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def ensure_running(self):
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            thread = threading.Thread(target=self._run, name='data-file-watcher', daemon=True)
+            thread.start()
+            self._pid = os.getpid()
+
+    def _run(self):
+        while True:
+            for dataset, path in self.files.items():
+                try:
+                    if self.versions.check_file(dataset, path):
+                        logging.info(f"Detected change to {path}, reloading {dataset}")
+                except Exception as e:
+                    logging.error(f"Error watching {path}: {str(e)}")
+            time.sleep(self.interval)
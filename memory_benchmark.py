@@ -0,0 +1,77 @@
+"""Compare the per-record memory footprint of JSON dicts and slotted records.
+
+Usage: python memory_benchmark.py [count]
+"""
+import json
+import sys
+import tracemalloc
+
+from records import submissions_from_json, teams_from_json, users_from_json, winners_from_rows
+
+TEAM_NAMES = ['Falcons', 'Xbox', 'Jackson 5', 'FALCONS', 'DEFAULT']
+
+
+def sample_users_and_teams(count):
+    """users_and_teams.json content with ten registrants per team."""
+    teams = [f'Team {i}' for i in range(max(1, count // 10))]
+    users = [{'email': f'user{i}@example.com', 'team': teams[i % len(teams)]}
+             for i in range(count)]
+    return {'teams': teams, 'users': users}
+
+
+def load_users_and_teams(data):
+    return teams_from_json(data['teams']), users_from_json(data['users'])
+
+
+def sample_submissions(count):
+    return [{
+        'email': f'user{i}@example.com',
+        'team_name': TEAM_NAMES[i % len(TEAM_NAMES)],
+        'project_name': f'Project {i}',
+        'github_repo': f'https://github.com/team{i}/project{i}',
+        'demo_video': f'https://www.youtube.com/watch?v=video{i}',
+        'live_demo_url': f'https://demo{i}.example.com',
+        'demo_credentials': {'username': 'judge', 'password': f'secret{i}'} if i % 2 else None,
+        'submitted_at': '2025-02-15T03:37:29.966962'
+    } for i in range(count)]
+
+
+def sample_winners(count):
+    return [{'team_name': TEAM_NAMES[i % len(TEAM_NAMES)], 'project_name': f'Project {i}', 'points': str(i % 100)}
+            for i in range(count)]
+
+
+def measure(build):
+    """Return the bytes still allocated by the object that build() returns."""
+    tracemalloc.start()
+    result = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+    datasets = [
+        ('users+teams', json.dumps(sample_users_and_teams(count)), load_users_and_teams),
+        ('submissions', json.dumps(sample_submissions(count)), submissions_from_json),
+    ]
+
+    print(f'{"dataset":<12} {"dict B/rec":>12} {"record B/rec":>14} {"saving":>8}')
+    for name, text, convert in datasets:
+        dict_size = measure(lambda: json.loads(text))
+        record_size = measure(lambda: convert(json.loads(text)))
+        print(f'{name:<12} {dict_size / count:>12.1f} {record_size / count:>14.1f} '
+              f'{1 - record_size / dict_size:>8.0%}')
+
+    rows = sample_winners(count)
+    dict_size = measure(lambda: [dict(row, points=int(row['points'])) for row in rows])
+    record_size = measure(lambda: winners_from_rows(rows))
+    print(f'{"winners":<12} {dict_size / count:>12.1f} {record_size / count:>14.1f} '
+          f'{1 - record_size / dict_size:>8.0%}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+import sys
+from dataclasses import dataclass
+from typing import Optional
+
+# Team names repeat across users, submissions and winners, so every record
+# shares a single interned copy of each name instead of one string per row.
+# Teams themselves are held as these interned strings: a record wrapping
+# the name would only add to its size.
+def intern_team_name(name):
+    if not name:
+        return ''
+    return sys.intern(name)
+
+
+@dataclass(slots=True)
+class User:
+    email: str
+    team: str = ''
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data['email'], intern_team_name(data.get('team', '')))
+
+    def to_dict(self):
+        return {'email': self.email, 'team': self.team}
+
+
+@dataclass(slots=True)
+class DemoCredentials:
+    username: str
+    password: str
+
+    @classmethod
+    def from_dict(cls, data):
+        if not data:
+            return None
+        return cls(data.get('username'), data.get('password'))
+
+    def to_dict(self):
+        return {'username': self.username, 'password': self.password}
+
+
+@dataclass(slots=True)
+class Submission:
+    email: str
+    team_name: str
+    project_name: str
+    github_repo: str
+    demo_video: str
+    live_demo_url: Optional[str] = None
+    demo_credentials: Optional[DemoCredentials] = None
+    submitted_at: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            data.get('email'),
+            intern_team_name(data.get('team_name')),
+            data.get('project_name'),
+            data.get('github_repo'),
+            data.get('demo_video'),
+            data.get('live_demo_url'),
+            DemoCredentials.from_dict(data.get('demo_credentials')),
+            data.get('submitted_at'),
+        )
+
+    def to_dict(self):
+        return {
+            'email': self.email,
+            'team_name': self.team_name,
+            'project_name': self.project_name,
+            'github_repo': self.github_repo,
+            'demo_video': self.demo_video,
+            'live_demo_url': self.live_demo_url,
+            'demo_credentials': self.demo_credentials.to_dict() if self.demo_credentials else None,
+            'submitted_at': self.submitted_at,
+        }
+
+
+@dataclass(slots=True)
+class Winner:
+    team_name: str
+    project_name: str
+    points: int
+
+    @classmethod
+    def from_row(cls, row):
+        return cls(intern_team_name(row['team_name']), row['project_name'], int(row['points']))
+
+    def to_row(self):
+        return {'team_name': self.team_name, 'project_name': self.project_name, 'points': self.points}
+
+
+def teams_from_json(data):
+    return [intern_team_name(name) for name in data]
+
+
+def users_from_json(data):
+    return [User.from_dict(user) for user in data]
+
+
+def submissions_from_json(data):
+    return [Submission.from_dict(submission) for submission in data]
+
+
+def winners_from_rows(rows):
+    return [Winner.from_row(row) for row in rows]
@@ -0,0 +1,265 @@
+import gc
+import re
+import threading
+from bisect import bisect_left, insort
+
+from records import Submission
+
+# Fields of a submission that are searchable, in addition to the
+# owner/name pair parsed out of the GitHub repository URL.
+SEARCH_FIELDS = ('project_name', 'team_name', 'email')
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+# Organisation URLs (github.com/orgs/<org>/...) carry the owner after "orgs/"
+GITHUB_PATTERN = re.compile(r'github\.com/(?:orgs/)?([^/?#]+)(?:/([^/?#]+))?', re.IGNORECASE)
+
+# Terms shorter than this are only matched exactly
+MIN_PREFIX_LENGTH = 2
+
+# Terms shorter than this are only matched exactly or by prefix
+MIN_FUZZY_LENGTH = 4
+
+# Ranking weights for the different kinds of term matches
+EXACT_SCORE = 3
+PREFIX_SCORE = 2
+FUZZY_SCORE = 1
+
+
+def tokenize(text):
+    if not text:
+        return []
+    return TOKEN_PATTERN.findall(str(text).lower())
+
+
+def deletions(token):
+    """Return the token plus every variant with a single character removed."""
+    variants = {token}
+    for i in range(len(token)):
+        variants.add(token[:i] + token[i + 1:])
+    return variants
+
+
+def within_one_edit(a, b):
+    """Whether a and b differ by at most one insertion, deletion,
+    substitution or swap of adjacent characters."""
+    if a == b:
+        return True
+    if abs(len(a) - len(b)) > 1:
+        return False
+    if len(a) > len(b):
+        a, b = b, a
+
+    i = 0
+    while i < len(a) and a[i] == b[i]:
+        i += 1
+    if len(a) < len(b):
+        return a[i:] == b[i + 1:]
+    return (a[i + 1:] == b[i + 1:]
+            or (a[i + 2:] == b[i + 2:] and a[i:i + 2] == b[i:i + 2][::-1]))
+
+
+def submission_tokens(submission):
+    tokens = set()
+    for field in SEARCH_FIELDS:
+        tokens.update(tokenize(getattr(submission, field)))
+
+    match = GITHUB_PATTERN.search(submission.github_repo or '')
+    if match:
+        for part in match.groups():
+            if part:
+                if part.endswith('.git'):
+                    part = part[:-4]
+                tokens.update(tokenize(part))
+    return tokens
+
+
+def _as_record(submission):
+    if isinstance(submission, dict):
+        return Submission.from_dict(submission)
+    return submission
+
+
+class SubmissionIndex:
+    """In-memory inverted index over submissions.
+
+    Submissions are held as slotted records rather than the dicts they are
+    loaded from, and are added one at a time so the index can be kept
+    current as submissions arrive, without rebuilding it. Every query term
+    must match an indexed token exactly, by prefix, or (for longer terms)
+    up to a single typo, found through a map of one-character deletions.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        # Data version the index was built from, None until first built
+        self.version = None
+        # Changes the source may have had besides appends, see sync
+        self.generation = None
+        self._documents = []
+        self._postings = {}
+        self._sorted_tokens = []
+        self._deletes = {}
+
+    def __len__(self):
+        return len(self._documents)
+
+    def clear(self):
+        with self._lock:
+            self._documents = []
+            self._postings = {}
+            self._sorted_tokens = []
+            self._deletes = {}
+
+    def documents(self):
+        with self._lock:
+            return list(self._documents)
+
+    def rebuild(self, submissions, version=0, generation=0):
+        with self._lock:
+            self.clear()
+            # The build allocates millions of small containers that never form
+            # cycles, so pause the cyclic collector rather than let it rescan them
+            gc_was_enabled = gc.isenabled()
+            gc.disable()
+            try:
+                for submission in submissions:
+                    self._add(submission, keep_sorted=False)
+            finally:
+                if gc_was_enabled:
+                    gc.enable()
+            # Sort the token list once instead of inserting in order per token
+            self._sorted_tokens = sorted(self._postings)
+            # Let the collector take its first pass over the new index here
+            # rather than stall whichever search happens to trigger it
+            gc.collect()
+            self.version = version
+            self.generation = generation
+
+    def sync(self, submissions, version, generation=0):
+        """Bring the index up to date with the full list of submissions.
+
+        Submissions are only ever appended, so normally just the ones past
+        the end of the index are added. The index is rebuilt when generation
+        changed, meaning the source may have been edited in place, or when
+        the list no longer starts with what the index holds. A list older
+        than the index's version is ignored.
+        """
+        with self._lock:
+            if generation == self.generation and self.version is not None and version <= self.version:
+                return
+            count = len(self._documents)
+            if (generation != self.generation or len(submissions) < count
+                    or (count and self._documents[-1] != _as_record(submissions[count - 1]))):
+                self.rebuild(submissions, version, generation)
+                return
+            for submission in submissions[len(self._documents):]:
+                self._add(submission)
+            if self.version is None or version > self.version:
+                self.version = version
+
+    def add(self, submission):
+        with self._lock:
+            return self._add(submission)
+
+    def _add(self, submission, keep_sorted=True):
+        submission = _as_record(submission)
+        doc_id = len(self._documents)
+        self._documents.append(submission)
+        for token in submission_tokens(submission):
+            postings = self._postings.get(token)
+            if postings is None:
+                postings = self._postings[token] = set()
+                if keep_sorted:
+                    insort(self._sorted_tokens, token)
+                # Most variants belong to a single token, so store that token
+                # directly and only switch to a set once a variant is shared
+                for variant in deletions(token):
+                    bucket = self._deletes.get(variant)
+                    if bucket is None:
+                        self._deletes[variant] = token
+                    elif isinstance(bucket, str):
+                        self._deletes[variant] = {bucket, token}
+                    else:
+                        bucket.add(token)
+            postings.add(doc_id)
+        return doc_id
+
+    def _prefix_tokens(self, term):
+        tokens = self._sorted_tokens
+        i = bisect_left(tokens, term)
+        while i < len(tokens) and tokens[i].startswith(term):
+            yield tokens[i]
+            i += 1
+
+    def _fuzzy_tokens(self, term):
+        # Deleting a character from both sides also pairs up tokens two
+        # edits apart, so confirm each candidate is really one typo away
+        candidates = set()
+        for variant in deletions(term):
+            bucket = self._deletes.get(variant)
+            if isinstance(bucket, str):
+                candidates.add(bucket)
+            elif bucket:
+                candidates.update(bucket)
+        return [token for token in candidates if within_one_edit(term, token)]
+
+    def _term_levels(self, term):
+        """Return [(score, doc_ids)] for a single query term, best first.
+
+        Each document appears at only the best level it reaches, so the
+        levels of a term never overlap.
+        """
+        postings = self._postings
+        exact = postings.get(term, set())
+        prefix = set()
+        fuzzy = set()
+        if len(term) >= MIN_PREFIX_LENGTH:
+            prefix = prefix.union(*[postings[token] for token in self._prefix_tokens(term)
+                                    if token != term])
+            prefix -= exact
+        if len(term) >= MIN_FUZZY_LENGTH:
+            fuzzy = fuzzy.union(*[postings[token] for token in self._fuzzy_tokens(term)])
+            fuzzy -= exact
+            fuzzy -= prefix
+
+        levels = [(EXACT_SCORE, exact), (PREFIX_SCORE, prefix), (FUZZY_SCORE, fuzzy)]
+        return [(score, doc_ids) for score, doc_ids in levels if doc_ids]
+
+    def search(self, query, limit=50):
+        terms = tokenize(query)
+        if not terms:
+            return []
+
+        with self._lock:
+            term_levels = [self._term_levels(term) for term in terms]
+            if not all(term_levels):
+                return []
+
+            # A document's score is the sum of the levels it reaches for each
+            # term. Rather than score documents one by one, intersect the
+            # level sets of every term, starting from the most selective term
+            # and dropping empty combinations, which groups the documents that
+            # match every term by their score.
+            term_levels.sort(key=lambda levels: sum(len(doc_ids) for _, doc_ids in levels))
+            groups = {}
+
+            def combine(index, score, doc_ids):
+                if index == len(term_levels):
+                    groups.setdefault(score, []).append(doc_ids)
+                    return
+                for level_score, level_ids in term_levels[index]:
+                    narrowed = level_ids if doc_ids is None else doc_ids & level_ids
+                    if narrowed:
+                        combine(index + 1, score + level_score, narrowed)
+
+            combine(0, 0, None)
+
+            # Best matches first, most recent submission first among ties
+            ranked = []
+            for score in sorted(groups, reverse=True):
+                group = groups[score]
+                doc_ids = group[0] if len(group) == 1 else set().union(*group)
+                ranked.extend(sorted(doc_ids, reverse=True)[:limit - len(ranked)])
+                if len(ranked) >= limit:
+                    break
+            return [self._documents[doc_id].to_dict() for doc_id in ranked]
@@ -388,41 +388,111 @@ function handleSubmission(event) {
     previewSubmission();
 }
 
+function renderSubmissions(submissions) {
+    const submissionsList = document.getElementById('submissionsList');
+    submissionsList.innerHTML = '';
+
+    if (submissions.length === 0) {
+        submissionsList.innerHTML = '<div class="list-group-item neuromorphic text-muted">No matching submissions</div>';
+        return;
+    }
+
+    submissions.forEach(submission => {
+        const submissionDate = new Date(submission.submitted_at).toLocaleString();
+        const item = document.createElement('div');
+        item.className = 'list-group-item neuromorphic mb-2';
+
+        item.innerHTML = `
+            <div class="d-flex justify-content-between align-items-center">
+                <div>
+                    <h5 class="mb-2">${submission.team_name}</h5>
+                    <p class="mb-2"><strong>Project:</strong> ${submission.project_name}</p>
+                    <strong>Email:</strong> ${submission.email}<br>
+                    <strong>GitHub:</strong> <a href="${submission.github_repo}" target="_blank">${submission.github_repo}</a><br>
+                    <strong>Demo Video:</strong> <a href="${submission.demo_video}" target="_blank">View Demo</a><br>
+                    <strong>Live Demo:</strong> <a href="${submission.live_demo_url}" target="_blank">View Live Demo</a>
+                </div>
+                <small class="text-muted">${submissionDate}</small>
+            </div>
+        `;
+        submissionsList.appendChild(item);
+    });
+}
+
+let submissionsSearchTimer = null;
+let submissionsRequest = null;
+
+// Fetch a submissions list, aborting any earlier list request still in
+// flight so a slow response can't replace the results of a newer one.
+function fetchSubmissionsList(url) {
+    if (submissionsRequest) {
+        submissionsRequest.abort();
+    }
+    const controller = new AbortController();
+    submissionsRequest = controller;
+
+    return fetch(url, { signal: controller.signal })
+        .then(response => {
+            if (!response.ok) {
+                throw new Error('Network response was not ok');
+            }
+            return response.json();
+        })
+        .finally(() => {
+            if (submissionsRequest === controller) {
+                submissionsRequest = null;
+            }
+        });
+}
+
 function loadSubmissions() {
-    fetch('/submissions')
-        .then(response => response.json())
+    clearTimeout(submissionsSearchTimer);
+    const searchInput = document.getElementById('submissionsSearch');
+    if (searchInput) {
+        searchInput.value = '';
+    }
+
+    fetchSubmissionsList('/submissions')
         .then(data => {
-            const submissionsList = document.getElementById('submissionsList');
-            submissionsList.innerHTML = '';
-
-            data.submissions.sort((a, b) => new Date(b.submitted_at) - new Date(a.submitted_at))
-                .forEach(submission => {
-                    const submissionDate = new Date(submission.submitted_at).toLocaleString();
-                    const item = document.createElement('div');
-                    item.className = 'list-group-item neuromorphic mb-2';
-
-                    item.innerHTML = `
-                        <div class="d-flex justify-content-between align-items-center">
-                            <div>
-                                <h5 class="mb-2">${submission.team_name}</h5>
-                                <p class="mb-2"><strong>Project:</strong> ${submission.project_name}</p>
-                                <strong>Email:</strong> ${submission.email}<br>
-                                <strong>GitHub:</strong> <a href="${submission.github_repo}" target="_blank">${submission.github_repo}</a><br>
-                                <strong>Demo Video:</strong> <a href="${submission.demo_video}" target="_blank">View Demo</a><br>
-                                <strong>Live Demo:</strong> <a href="${submission.live_demo_url}" target="_blank">View Live Demo</a>
-                            </div>
-                            <small class="text-muted">${submissionDate}</small>
-                        </div>
-                    `;
-                    submissionsList.appendChild(item);
-                });
+            renderSubmissions(data.submissions.sort((a, b) => new Date(b.submitted_at) - new Date(a.submitted_at)));
         })
         .catch(error => {
+            if (error.name === 'AbortError') {
+                return;
+            }
             console.error('Error loading submissions:', error);
             showAlert('Error loading submissions');
         });
 }
 
+function searchSubmissions(query) {
+    clearTimeout(submissionsSearchTimer);
+    if (!query.trim()) {
+        loadSubmissions();
+        return;
+    }
+
+    // Results for the previous query are stale as soon as the query changes
+    if (submissionsRequest) {
+        submissionsRequest.abort();
+    }
+
+    submissionsSearchTimer = setTimeout(() => {
+        fetchSubmissionsList(`/submissions/search?q=${encodeURIComponent(query)}`)
+            .then(data => {
+                // Results arrive ranked by relevance, so keep the server order
+                renderSubmissions(data.submissions);
+            })
+            .catch(error => {
+                if (error.name === 'AbortError') {
+                    return;
+                }
+                console.error('Error searching submissions:', error);
+                showAlert('Error searching submissions');
+            });
+    }, 200);
+}
+
 function handleAdminLogin(event) {
     event.preventDefault();
 
@@ -1140,6 +1210,14 @@ document.addEventListener('DOMContentLoaded', function() {
         loadSubmissions();
     }
 
+    // Submissions search box
+    const submissionsSearch = document.getElementById('submissionsSearch');
+    if (submissionsSearch) {
+        submissionsSearch.addEventListener('input', function() {
+            searchSubmissions(this.value);
+        });
+    }
+
     // Update hackathon details deadlines
     updateHackathonDeadlines();
 
@@ -0,0 +1,144 @@
+import os
+import threading
+import time
+
+import pytest
+
+from data_versions import DataVersions, VersionedCache
+
+
+@pytest.fixture
+def versions(tmp_path):
+    return DataVersions(str(tmp_path / 'versions.bin'))
+
+
+@pytest.fixture
+def data_file(tmp_path):
+    path = tmp_path / 'data.json'
+    path.write_text('[]')
+    return str(path)
+
+
+def write(path, text):
+    with open(path, 'w') as f:
+        f.write(text)
+
+
+def set_mtime(path, seconds):
+    os.utime(path, ns=(seconds * 10**9, seconds * 10**9))
+
+
+def test_writing_bumps_version(versions, data_file):
+    assert versions.get('submissions') == 0
+    with versions.writing('submissions', data_file) as version:
+        write(data_file, '[1]')
+    assert version == 1
+    assert versions.get('submissions') == 1
+    assert versions.get('users') == 0
+
+
+def test_writing_bumps_version_when_write_fails(versions, data_file):
+    with pytest.raises(OSError):
+        with versions.writing('submissions', data_file):
+            raise OSError('disk full')
+    assert versions.get('submissions') == 1
+
+
+def test_versions_are_shared_between_instances(tmp_path, data_file):
+    path = str(tmp_path / 'versions.bin')
+    first, second = DataVersions(path), DataVersions(path)
+    with first.writing('winners', data_file):
+        write(data_file, '[1]')
+    assert second.get('winners') == 1
+
+
+def test_check_file_ignores_writes_through_the_app(versions, data_file):
+    versions.check_file('submissions', data_file)
+    with versions.writing('submissions', data_file):
+        write(data_file, '[1]')
+    assert versions.check_file('submissions', data_file) is False
+    assert versions.external_edits('submissions') == 0
+
+
+def test_check_file_counts_outside_edits(versions, data_file):
+    set_mtime(data_file, 1000)
+    # The first mtime seen is recorded without counting as an edit
+    assert versions.check_file('submissions', data_file) is True
+    assert versions.external_edits('submissions') == 0
+    assert versions.check_file('submissions', data_file) is False
+
+    set_mtime(data_file, 2000)
+    assert versions.check_file('submissions', data_file) is True
+    assert versions.external_edits('submissions') == 1
+    assert versions.get('submissions') == 2
+
+
+def test_watcher_polling_during_a_write_is_not_an_outside_edit(versions, data_file):
+    versions.check_file('submissions', data_file)
+    stop = threading.Event()
+
+    def poll():
+        while not stop.is_set():
+            versions.check_file('submissions', data_file)
+
+    watcher = threading.Thread(target=poll)
+    watcher.start()
+    try:
+        for i in range(5):
+            with versions.writing('submissions', data_file):
+                write(data_file, '[')
+                time.sleep(0.01)
+                write(data_file, f'[{i}]')
+    finally:
+        stop.set()
+        watcher.join()
+
+    assert versions.external_edits('submissions') == 0
+    # One bump for the first mtime seen, then one per write
+    assert versions.get('submissions') == 6
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason='requires fork')
+def test_writes_from_forked_workers_are_serialised(versions, data_file):
+    # Open the versions file before forking, as a preloading master would
+    versions.get('submissions')
+
+    def append_rows(worker):
+        for i in range(20):
+            with versions.writing('submissions', data_file):
+                with open(data_file) as f:
+                    rows = f.read().split()
+                rows.append(f'{worker}-{i}')
+                write(data_file, '\n'.join(rows))
+
+    children = []
+    for worker in range(2):
+        pid = os.fork()
+        if pid == 0:
+            try:
+                append_rows(worker)
+            finally:
+                os._exit(0)
+        children.append(pid)
+    for pid in children:
+        os.waitpid(pid, 0)
+
+    with open(data_file) as f:
+        rows = [row for row in f.read().split() if row != '[]']
+    assert len(rows) == 40
+    assert versions.get('submissions') == 40
+
+
+def test_versioned_cache_reloads_only_after_a_write(versions, data_file):
+    cache = VersionedCache(versions)
+    loads = []
+
+    def loader():
+        loads.append(1)
+        return len(loads)
+
+    assert cache.get('details', loader) == 1
+    assert cache.get('details', loader) == 1
+    with versions.writing('details', data_file):
+        write(data_file, '{}')
+    assert cache.get('details', loader) == 2
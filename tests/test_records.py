@@ -0,0 +1,33 @@
+from records import (Submission, submissions_from_json, teams_from_json, users_from_json,
+                     winners_from_rows)
+
+
+def test_submissions_round_trip():
+    data = [{
+        'email': 'jane.smith@example.com',
+        'team_name': 'Jackson 5',
+        'project_name': 'Wonder',
+        'github_repo': 'https://github.com/owner/repo',
+        'demo_video': 'https://www.youtube.com/watch?v=video',
+        'live_demo_url': 'https://falcons.ai',
+        'demo_credentials': {'username': 'judge', 'password': 'secret'},
+        'submitted_at': '2025-02-11T05:34:21.550549',
+    }]
+    assert [submission.to_dict() for submission in submissions_from_json(data)] == data
+
+
+def test_submission_without_email():
+    assert Submission.from_dict({'project_name': 'Wonder'}).email is None
+
+
+def test_team_names_are_shared():
+    teams = teams_from_json([''.join(['Fal', 'cons'])])
+    users = users_from_json([{'email': 'a@example.com', 'team': ''.join(['Falc', 'ons'])}])
+    assert teams == ['Falcons']
+    assert users[0].team is teams[0]
+
+
+def test_winners_round_trip_with_integer_points():
+    rows = [{'team_name': 'Falcons', 'project_name': 'AI Assistant', 'points': '95'}]
+    assert [winner.to_row() for winner in winners_from_rows(rows)] == [
+        {'team_name': 'Falcons', 'project_name': 'AI Assistant', 'points': 95}]
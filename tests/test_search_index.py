@@ -0,0 +1,158 @@
+import pytest
+
+from search_index import SubmissionIndex, submission_tokens, within_one_edit
+from records import Submission
+
+
+def submission(project_name, team_name='Team', email='team@example.com',
+               github_repo='https://github.com/owner/repo'):
+    return {
+        'email': email,
+        'team_name': team_name,
+        'project_name': project_name,
+        'github_repo': github_repo,
+        'demo_video': 'https://example.com/video',
+    }
+
+
+def project_names(results):
+    return [result['project_name'] for result in results]
+
+
+@pytest.mark.parametrize('a, b, expected', [
+    ('abcd', 'abcd', True),
+    ('abcd', 'abxd', True),
+    ('abcd', 'abc', True),
+    ('abcd', 'xabcd', True),
+    ('abcd', 'bacd', True),
+    ('abcd', 'abdc', True),
+    ('abcd', 'bcde', False),
+    ('abcd', 'badc', False),
+    ('abcd', 'ab', False),
+])
+def test_within_one_edit(a, b, expected):
+    assert within_one_edit(a, b) is expected
+    assert within_one_edit(b, a) is expected
+
+
+def test_submission_tokens_skip_github_orgs_segment():
+    record = Submission.from_dict(submission(
+        'Wonder', github_repo='https://github.com/orgs/Falcons-ai/people/repo'))
+    tokens = submission_tokens(record)
+    assert {'falcons', 'ai', 'people'} <= tokens
+    assert 'orgs' not in tokens
+
+
+def test_exact_prefix_and_fuzzy_matches_rank_in_that_order():
+    index = SubmissionIndex()
+    index.rebuild([
+        submission('Falcon'),
+        submission('Falconry'),
+        submission('Falcom'),
+    ])
+    assert project_names(index.search('falcon')) == ['Falcon', 'Falconry', 'Falcom']
+
+
+def test_fuzzy_match_is_limited_to_one_edit():
+    index = SubmissionIndex()
+    index.rebuild([submission('abcd')])
+    assert project_names(index.search('abce')) == ['abcd']
+    assert index.search('bcde') == []
+
+
+def test_single_character_terms_only_match_exactly():
+    index = SubmissionIndex()
+    index.rebuild([submission('Project'), submission('P')])
+    assert project_names(index.search('p')) == ['P']
+
+
+def test_ties_return_most_recent_submission_first():
+    index = SubmissionIndex()
+    index.rebuild([submission('Alpha one'), submission('Alpha two')])
+    assert project_names(index.search('alpha')) == ['Alpha two', 'Alpha one']
+
+
+def test_prefix_expansion_is_intersected_before_limiting():
+    submissions = [submission(f'project{i:03d}') for i in range(150)]
+    submissions.append(submission('projectzeta', team_name='Falcons'))
+    index = SubmissionIndex()
+    index.rebuild(submissions)
+
+    assert project_names(index.search('proj falcons')) == ['projectzeta']
+    assert project_names(index.search('pro falcons')) == ['projectzeta']
+
+
+def test_every_term_must_match():
+    index = SubmissionIndex()
+    index.rebuild([
+        submission('Uplift', team_name='Falcons'),
+        submission('Wonder', team_name='Jackson'),
+    ])
+    assert project_names(index.search('uplift falcons')) == ['Uplift']
+    assert index.search('uplift jackson') == []
+
+
+def test_limit():
+    index = SubmissionIndex()
+    index.rebuild([submission(f'Project {i}') for i in range(10)])
+    assert len(index.search('project', limit=3)) == 3
+
+
+def test_sync_appends_only_new_submissions():
+    index = SubmissionIndex()
+    submissions = [submission('Alpha')]
+    index.sync(submissions, version=1)
+
+    rebuilds = []
+    rebuild = index.rebuild
+    index.rebuild = lambda *args, **kwargs: (rebuilds.append(args), rebuild(*args, **kwargs))
+
+    submissions.append(submission('Beta'))
+    index.sync(submissions, version=2)
+
+    assert rebuilds == []
+    assert index.version == 2
+    assert project_names(index.search('beta')) == ['Beta']
+
+
+def test_sync_rebuilds_when_generation_changes():
+    index = SubmissionIndex()
+    index.sync([submission('Alpha')], version=1)
+
+    index.sync([submission('Renamed')], version=2, generation=1)
+
+    assert project_names(index.search('renamed')) == ['Renamed']
+    assert index.search('alpha') == []
+    assert index.generation == 1
+def test_sync_rebuilds_when_submissions_were_rewritten():
+    index = SubmissionIndex()
+    index.sync([submission('Alpha'), submission('Beta')], version=1)
+
+    index.sync([submission('Alpha'), submission('Gamma'), submission('Delta')], version=2)
+
+    assert project_names(index.search('gamma')) == ['Gamma']
+    assert index.search('beta') == []
+    assert len(index) == 3
+
+
+
+
+def test_sync_rebuilds_when_last_submission_differs():
+    index = SubmissionIndex()
+    index.sync([submission('Alpha'), submission('Mine')], version=1)
+
+    # Another worker's save replaced the row this index appended
+    index.sync([submission('Alpha'), submission('Theirs')], version=2)
+
+    assert project_names(index.search('theirs')) == ['Theirs']
+    assert index.search('mine') == []
+
+
+def test_sync_ignores_older_versions():
+    index = SubmissionIndex()
+    index.sync([submission('Alpha'), submission('Beta')], version=2)
+
+    index.sync([submission('Alpha')], version=1)
+
+    assert len(index) == 2
+    assert index.version == 2